@@ -4,9 +4,13 @@ Bulk Test Data Generator for LibOps Platform
 Generates hundreds of organizations with Seinfeld and Twin Peaks themed data
 """
 
+import io
 import random
 import hashlib
+from collections import namedtuple
 from datetime import datetime, timedelta
+from functools import lru_cache
+from multiprocessing import Pool
 
 # Seinfeld Characters (Main + Supporting + Minor)
 SEINFELD_CHARACTERS = [
@@ -17,7 +21,6 @@ SEINFELD_CHARACTERS = [
     ("Susan", "Ross", "susan.ross"),
     ("Uncle Leo", "", "uncle.leo"),
     ("Kenny", "Bania", "kenny.bania"),
-    ("Puddy", "David", "david.puddy"),
     ("Mr.", "Pitt", "mr.pitt"),
     ("Steinbrenner", "George", "george.steinbrenner"),
     ("Mr.", "Wilhelm", "mr.wilhelm"),
@@ -34,7 +37,6 @@ SEINFELD_CHARACTERS = [
     ("Keith", "Hernandez", "keith.hernandez"),
     ("Russell", "Dalrymple", "russell.dalrymple"),
     ("Jack", "Klompus", "jack.klompus"),
-    ("Morty", "Seinfeld", "morty.seinfeld"),
     ("Mr.", "Lippman", "mr.lippman"),
     ("Jake", "Jarmel", "jake.jarmel"),
     ("Joel", "Rifkin", "joel.rifkin"),
@@ -155,300 +157,355 @@ PROJECT_NAMES = [
 # Site environment names
 SITE_ENVS = ["production", "staging", "development", "qa", "demo", "sandbox"]
 
-def generate_uuid_from_seed(prefix, seed):
-    """Generate a deterministic UUID from a seed"""
-    hash_obj = hashlib.md5(f"{prefix}-{seed}".encode())
-    hex_str = hash_obj.hexdigest()
-    return f"{prefix}-{hex_str[8:12]}-{hex_str[12:16]}-{hex_str[16:20]}-{hex_str[20:32]}"
+# GCP placement, indexed by resource ID (zones line up with their region)
+GCP_REGIONS = ("us-central1", "us-east1", "us-west1")
+GCP_ZONES = ("us-central1-a", "us-east1-b", "us-west1-c")
+MACHINE_TYPES = ("e2-micro", "e2-small", "e2-medium", "e2-standard-2")
+
+# Rows per multi-row INSERT; keeps each statement well under max_allowed_packet
+BATCH_SIZE = 500
+
+# Column lists for every table the bulk seed writes to
+TABLE_COLUMNS = {
+    "accounts": "id, public_id, email, name, auth_method, verified, vault_entity_id, created_at",
+    "api_keys": "public_id, account_id, name, description, scopes, active, created_by, created_at",
+    "organizations": "id, public_id, name, gcp_org_id, gcp_billing_account, gcp_parent, location, region, gcp_folder_id, status, gcp_project_id, gcp_project_number, created_by, created_at",
+    "relationships": "id, public_id, source_organization_id, target_organization_id, relationship_type, status",
+    "organization_members": "public_id, organization_id, account_id, role, status, created_by, created_at",
+    "projects": "id, public_id, organization_id, name, github_repository, github_branch, gcp_region, gcp_zone, machine_type, gcp_project_id, gcp_project_number, status, created_by, created_at",
+    "project_members": "public_id, project_id, account_id, role, status, created_by, created_at",
+    "sites": "id, public_id, project_id, name, github_ref, gcp_external_ip, status, created_by, created_at",
+    "site_members": "public_id, site_id, account_id, role, status, created_by, created_at",
+}
+
+# Relax per-row checks for the duration of the import, then restore them.
+# unique_checks stays on: ALL_CHARACTERS wraps around in large orgs, so emails
+# repeat and must still be rejected by the UNIQUE key on accounts.email.
+BULK_LOAD_BEGIN = """SET foreign_key_checks=0;
+SET autocommit=0;
 
-def sanitize_name(name):
-    """Sanitize name for use in emails and IDs"""
-    return name.lower().replace(" ", ".").replace("'", "").replace(".", "")
+"""
+BULK_LOAD_END = """COMMIT;
+SET foreign_key_checks=1;
+SET autocommit=1;
+"""
 
-def main():
-    # Configuration
-    NUM_ORGS = 200
-    MIN_PROJECTS_PER_ORG = 0
-    MAX_PROJECTS_PER_ORG = 20
-    MIN_SITES_PER_PROJECT = 0
-    MAX_SITES_PER_PROJECT = 5
-    MIN_MEMBERS_PER_RESOURCE = 0
-    MAX_MEMBERS_PER_RESOURCE = 10
+class InsertBatch:
+    """Buffers VALUES tuples for one table and writes them as multi-row INSERTs"""
 
-    # Starting IDs
-    account_id = 100
-    org_id = 100
-    project_id = 100
-    site_id = 100
-    relationship_id = 100
+    def __init__(self, writelines, table, columns):
+        self.writelines = writelines
+        self.prefix = f"INSERT INTO {table} ({columns}) VALUES\n"
+        self.rows = []
+        # Rows are added with a bare list.append; batching happens in flush()
+        self.add = self.rows.append
 
-    # Combine character pools
-    all_characters = SEINFELD_CHARACTERS + TWIN_PEAKS_CHARACTERS
-    all_org_names = SEINFELD_ORGS + TWIN_PEAKS_ORGS
+    def flush(self):
+        """Write every buffered row, BATCH_SIZE rows per INSERT"""
+        rows = self.rows
+        for start in range(0, len(rows), BATCH_SIZE):
+            # Hand the pieces to writelines rather than concatenating them first
+            self.writelines((self.prefix, ",\n".join(rows[start:start + BATCH_SIZE]), ";\n\n"))
+        rows.clear()
 
-    # Track used characters
-    character_index = 0
+def uuid_generator(prefix):
+    """Build a deterministic UUID generator for a prefix, hashing the prefix only once"""
+    base_hash = hashlib.blake2s(f"{prefix}-".encode(), digest_size=16)
 
-    output = []
-    output.append("-- ============================================")
-    output.append("-- BULK TEST DATA - AUTO GENERATED")
-    output.append(f"-- Generated: {datetime.now().isoformat()}")
-    output.append(f"-- Organizations: {NUM_ORGS}")
-    output.append("-- ============================================\n")
+    def generate_uuid_from_seed(seed):
+        """Generate a deterministic UUID from a seed, as 32 hex chars without dashes"""
+        hash_obj = base_hash.copy()
+        hash_obj.update(seed.encode())
+        return prefix + hash_obj.hexdigest()[8:32]
 
-    # Generate Organizations
-    for org_num in range(NUM_ORGS):
-        org_name = all_org_names[org_num % len(all_org_names)]
-        if org_num >= len(all_org_names):
-            org_name = f"{org_name} #{org_num // len(all_org_names) + 1}"
+    return generate_uuid_from_seed
 
-        org_uuid = generate_uuid_from_seed("0rg00000", f"bulk-{org_id}")
+# Characters dropped from names when building emails and IDs
+SANITIZE_TABLE = str.maketrans("", "", " '.")
 
-        # Pick an owner for this org
-        if character_index >= len(all_characters):
+@lru_cache(maxsize=None)
+def sanitize_name(name):
+    """Sanitize name for use in emails and IDs"""
+    return name.lower().translate(SANITIZE_TABLE)
+
+# Combined character pool as (username, display name) pairs
+ALL_CHARACTERS = [
+    (username, f"{first} {last}".strip())
+    for first, last, username in SEINFELD_CHARACTERS + TWIN_PEAKS_CHARACTERS
+]
+ALL_ORG_NAMES = SEINFELD_ORGS + TWIN_PEAKS_ORGS
+
+# Deterministic UUID generators, one per ID prefix
+org_uuid_for = uuid_generator("0rg00000")
+account_uuid_for = uuid_generator("acc00000")
+apikey_uuid_for = uuid_generator("ap1key00")
+relationship_uuid_for = uuid_generator("re1at000")
+org_member_uuid_for = uuid_generator("0rgmem00")
+project_uuid_for = uuid_generator("pr0j0000")
+project_member_uuid_for = uuid_generator("pr0jmem0")
+site_uuid_for = uuid_generator("51te0000")
+site_member_uuid_for = uuid_generator("51temem0")
+
+# Everything a worker needs to generate one organization on its own. projects
+# holds (num_members, site_member_counts) for each project in the org.
+OrgSpec = namedtuple("OrgSpec", [
+    "seed", "org_num", "org_id", "account_id", "project_id", "site_id", "relationship_id",
+    "character_index", "num_additional_members", "projects",
+])
+
+def draw(rng, low, high, count):
+    """Draw count random ints in [low, high] in one call, as a list"""
+    return rng.choices(range(low, high + 1), k=count)
+
+def generate_org_sql(spec):
+    """Generate the SQL for one organization from its OrgSpec"""
+    (seed, org_num, org_id, account_id, project_id, site_id, relationship_id,
+     character_index, num_additional_members, projects) = spec
+
+    # Per-org generator, so output doesn't depend on how orgs are spread over workers
+    rng = random.Random(seed)
+    rand = rng.random
+
+    # Draw this org's site values in one batch each
+    num_sites = sum(len(site_member_counts) for _, site_member_counts in projects)
+    site_ips = [
+        f"35.{a}.{b}.{c}"
+        for a, b, c in zip(draw(rng, 190, 250, num_sites), draw(rng, 1, 254, num_sites), draw(rng, 1, 254, num_sites))
+    ]
+    site_refs = [
+        f"tags/v{major}.{minor}.{patch}"
+        for major, minor, patch in zip(draw(rng, 1, 5, num_sites), draw(rng, 0, 20, num_sites), draw(rng, 0, 10, num_sites))
+    ]
+    next_site_ip = iter(site_ips).__next__
+    next_site_ref = iter(site_refs).__next__
+
+    # One multi-row INSERT buffer per table, all writing into one in-memory buffer
+    output = io.StringIO()
+    batches = {table: InsertBatch(output.writelines, table, columns) for table, columns in TABLE_COLUMNS.items()}
+    add_account = batches["accounts"].add
+    add_api_key = batches["api_keys"].add
+    add_organization = batches["organizations"].add
+    add_relationship = batches["relationships"].add
+    add_org_member = batches["organization_members"].add
+    add_project = batches["projects"].add
+    add_project_member = batches["project_members"].add
+    add_site = batches["sites"].add
+    add_site_member = batches["site_members"].add
+
+    org_name = ALL_ORG_NAMES[org_num % len(ALL_ORG_NAMES)]
+    if org_num >= len(ALL_ORG_NAMES):
+        org_name = f"{org_name} #{org_num // len(ALL_ORG_NAMES) + 1}"
+
+    org_uuid = org_uuid_for(f"bulk-{org_id}")
+
+    # Pick an owner for this org
+    if character_index >= len(ALL_CHARACTERS):
+        character_index = 0
+
+    owner_username, owner_name = ALL_CHARACTERS[character_index]
+    character_index += 1
+
+    owner_id = account_id
+    account_id += 1
+
+    org_slug = sanitize_name(org_name)
+    owner_email = f"{owner_username}@{org_slug}.com"
+    owner_uuid = account_uuid_for(f"bulk-{owner_id}")
+
+    # Create owner account
+    add_account(f"({owner_id}, UNHEX('{owner_uuid}'), '{owner_email}', '{owner_name}', 'apikey', TRUE, 'entity-bulk-{owner_id}', NOW())")
+
+    # Create API key for owner
+    apikey_uuid = apikey_uuid_for(f"bulk-{owner_id}")
+    add_api_key(f"(UNHEX('{apikey_uuid}'), {owner_id}, '{owner_name} Full Access', 'Auto-generated bulk data', '[]', TRUE, {owner_id}, NOW())")
+
+    # Create organization
+    gcp_org_id = 1000000000 + org_id
+    gcp_folder_id = 2000000000 + org_id
+    gcp_project_num = 3000000000 + org_id
+
+    add_organization(f"({org_id}, UNHEX('{org_uuid}'), '{org_name}', '{gcp_org_id}', 'BULK-BILLING-{org_id}', 'organizations/{gcp_org_id}', 'us', '{GCP_REGIONS[org_id % 3]}', 'folders/{gcp_folder_id}', 'active', '{org_slug}-platform', '{gcp_project_num}', {owner_id}, NOW())")
+
+    # Create relationship to LibOps root org (org_id=1)
+    rel_uuid = relationship_uuid_for(f"bulk-{relationship_id}")
+    add_relationship(f"({relationship_id}, UNHEX('{rel_uuid}'), 1, {org_id}, 'access', 'approved')")
+    relationship_id += 1
+
+    # Add owner as organization member
+    orgmem_uuid = org_member_uuid_for(f"bulk-{org_id}-{owner_id}")
+    add_org_member(f"(UNHEX('{orgmem_uuid}'), {org_id}, {owner_id}, 'owner', 'active', {owner_id}, NOW())")
+
+    # Additional org members
+    for mem_num in range(num_additional_members):
+        if character_index >= len(ALL_CHARACTERS):
             character_index = 0
 
-        owner_first, owner_last, owner_username = all_characters[character_index]
+        mem_username, mem_name = ALL_CHARACTERS[character_index]
         character_index += 1
 
-        owner_id = account_id
+        mem_id = account_id
         account_id += 1
 
-        owner_name = f"{owner_first} {owner_last}".strip()
-        owner_email = f"{owner_username}@{sanitize_name(org_name)}.com"
-        owner_uuid = generate_uuid_from_seed("acc00000", f"bulk-{owner_id}")
-
-        # Create owner account
-        output.append(f"-- Organization: {org_name}")
-        output.append(f"INSERT INTO accounts (id, public_id, email, name, auth_method, verified, vault_entity_id, created_at)")
-        output.append(f"VALUES (")
-        output.append(f"    {owner_id},")
-        output.append(f"    UNHEX(REPLACE('{owner_uuid}', '-', '')),")
-        output.append(f"    '{owner_email}',")
-        output.append(f"    '{owner_name}',")
-        output.append(f"    'apikey',")
-        output.append(f"    TRUE,")
-        output.append(f"    'entity-bulk-{owner_id}',")
-        output.append(f"    NOW()")
-        output.append(f");")
-        output.append("")
-
-        # Create API key for owner
-        apikey_uuid = generate_uuid_from_seed("ap1key00", f"bulk-{owner_id}")
-        output.append(f"INSERT INTO api_keys (public_id, account_id, name, description, scopes, active, created_by, created_at)")
-        output.append(f"VALUES (")
-        output.append(f"    UNHEX(REPLACE('{apikey_uuid}', '-', '')),")
-        output.append(f"    {owner_id},")
-        output.append(f"    '{owner_name} Full Access',")
-        output.append(f"    'Auto-generated bulk data',")
-        output.append(f"    '[]',")
-        output.append(f"    TRUE,")
-        output.append(f"    {owner_id},")
-        output.append(f"    NOW()")
-        output.append(f");")
-        output.append("")
-
-        # Create organization
-        gcp_org_id = 1000000000 + org_id
-        gcp_folder_id = 2000000000 + org_id
-        gcp_project_num = 3000000000 + org_id
-
-        output.append(f"INSERT INTO organizations (id, public_id, name, gcp_org_id, gcp_billing_account, gcp_parent, location, region, gcp_folder_id, status, gcp_project_id, gcp_project_number, created_by, created_at)")
-        output.append(f"VALUES (")
-        output.append(f"    {org_id},")
-        output.append(f"    UNHEX(REPLACE('{org_uuid}', '-', '')),")
-        output.append(f"    '{org_name}',")
-        output.append(f"    '{gcp_org_id}',")
-        output.append(f"    'BULK-BILLING-{org_id}',")
-        output.append(f"    'organizations/{gcp_org_id}',")
-        output.append(f"    'us',")
-        output.append(f"    'us-{['central', 'east', 'west'][org_id % 3]}1',")
-        output.append(f"    'folders/{gcp_folder_id}',")
-        output.append(f"    'active',")
-        output.append(f"    '{sanitize_name(org_name)}-platform',")
-        output.append(f"    '{gcp_project_num}',")
-        output.append(f"    {owner_id},")
-        output.append(f"    NOW()")
-        output.append(f");")
-        output.append("")
-
-        # Create relationship to LibOps root org (org_id=1)
-        rel_uuid = generate_uuid_from_seed("re1at000", f"bulk-{relationship_id}")
-        output.append(f"INSERT INTO relationships (id, public_id, source_organization_id, target_organization_id, relationship_type, status)")
-        output.append(f"VALUES (")
-        output.append(f"    {relationship_id},")
-        output.append(f"    UNHEX(REPLACE('{rel_uuid}', '-', '')),")
-        output.append(f"    1,")  # LibOps Platform
-        output.append(f"    {org_id},")
-        output.append(f"    'access',")
-        output.append(f"    'approved'")
-        output.append(f");")
-        output.append("")
-        relationship_id += 1
+        mem_email = f"{mem_username}@{org_slug}.com"
+        mem_uuid = account_uuid_for(f"bulk-{mem_id}")
+        mem_role = 'developer' if rand() < 2 / 3 else 'read'  # Weight towards developer
+
+        # Create member account and add as org member
+        orgmem_uuid = org_member_uuid_for(f"bulk-{org_id}-{mem_id}")
+        add_account(f"({mem_id}, UNHEX('{mem_uuid}'), '{mem_email}', '{mem_name}', 'apikey', TRUE, 'entity-bulk-{mem_id}', NOW())")
+        add_org_member(f"(UNHEX('{orgmem_uuid}'), {org_id}, {mem_id}, '{mem_role}', 'active', {owner_id}, NOW())")
+
+    # Generate Projects for this org
+    for proj_num, (num_proj_members, site_member_counts) in enumerate(projects):
+        project_name = f"Project {PROJECT_NAMES[proj_num % len(PROJECT_NAMES)]}"
+        if proj_num >= len(PROJECT_NAMES):
+            project_name = f"{project_name} #{proj_num // len(PROJECT_NAMES) + 1}"
+        project_slug = sanitize_name(project_name)
+
+        proj_uuid = project_uuid_for(f"bulk-{project_id}")
+        proj_gcp_num = 4000000000 + project_id
 
-        # Add owner as organization member
-        orgmem_uuid = generate_uuid_from_seed("0rgmem00", f"bulk-{org_id}-{owner_id}")
-        output.append(f"INSERT INTO organization_members (public_id, organization_id, account_id, role, status, created_by, created_at)")
-        output.append(f"VALUES (")
-        output.append(f"    UUID_TO_BIN('{orgmem_uuid}'),")
-        output.append(f"    {org_id},")
-        output.append(f"    {owner_id},")
-        output.append(f"    'owner',")
-        output.append(f"    'active',")
-        output.append(f"    {owner_id},")
-        output.append(f"    NOW()")
-        output.append(f");")
-        output.append("")
-
-        # Additional org members
-        num_additional_members = random.randint(MIN_MEMBERS_PER_RESOURCE, min(5, MAX_MEMBERS_PER_RESOURCE))
-        for mem_num in range(num_additional_members):
-            if character_index >= len(all_characters):
+        add_project(f"({project_id}, UNHEX('{proj_uuid}'), {org_id}, '{project_name}', '{org_slug}/{project_slug}', 'main', '{GCP_REGIONS[project_id % 3]}', '{GCP_ZONES[project_id % 3]}', '{MACHINE_TYPES[project_id % 4]}', '{org_slug}-{project_slug}', '{proj_gcp_num}', 'active', {owner_id}, NOW())")
+
+        # Project members
+        for proj_mem_num in range(num_proj_members):
+            if character_index >= len(ALL_CHARACTERS):
                 character_index = 0
 
-            mem_first, mem_last, mem_username = all_characters[character_index]
+            proj_mem_username, proj_mem_name = ALL_CHARACTERS[character_index]
             character_index += 1
 
-            mem_id = account_id
+            proj_mem_id = account_id
             account_id += 1
 
-            mem_name = f"{mem_first} {mem_last}".strip()
-            mem_email = f"{mem_username}@{sanitize_name(org_name)}.com"
-            mem_uuid = generate_uuid_from_seed("acc00000", f"bulk-{mem_id}")
-            mem_role = random.choice(['developer', 'developer', 'read'])  # Weight towards developer
-
-            # Create member account
-            output.append(f"INSERT INTO accounts (id, public_id, email, name, auth_method, verified, vault_entity_id, created_at)")
-            output.append(f"VALUES ({mem_id}, UNHEX(REPLACE('{mem_uuid}', '-', '')), '{mem_email}', '{mem_name}', 'apikey', TRUE, 'entity-bulk-{mem_id}', NOW());")
-            output.append("")
-
-            # Add as org member
-            orgmem_uuid = generate_uuid_from_seed("0rgmem00", f"bulk-{org_id}-{mem_id}")
-            output.append(f"INSERT INTO organization_members (public_id, organization_id, account_id, role, status, created_by, created_at)")
-            output.append(f"VALUES (UUID_TO_BIN('{orgmem_uuid}'), {org_id}, {mem_id}, '{mem_role}', 'active', {owner_id}, NOW());")
-            output.append("")
-
-        # Generate Projects for this org
-        num_projects = random.randint(MIN_PROJECTS_PER_ORG, MAX_PROJECTS_PER_ORG)
-        for proj_num in range(num_projects):
-            project_name = f"Project {PROJECT_NAMES[proj_num % len(PROJECT_NAMES)]}"
-            if proj_num >= len(PROJECT_NAMES):
-                project_name = f"{project_name} #{proj_num // len(PROJECT_NAMES) + 1}"
-
-            proj_uuid = generate_uuid_from_seed("pr0j0000", f"bulk-{project_id}")
-            proj_gcp_num = 4000000000 + project_id
-
-            output.append(f"-- Project: {project_name} ({org_name})")
-            output.append(f"INSERT INTO projects (id, public_id, organization_id, name, github_repository, github_branch, gcp_region, gcp_zone, machine_type, gcp_project_id, gcp_project_number, status, created_by, created_at)")
-            output.append(f"VALUES (")
-            output.append(f"    {project_id},")
-            output.append(f"    UNHEX(REPLACE('{proj_uuid}', '-', '')),")
-            output.append(f"    {org_id},")
-            output.append(f"    '{project_name}',")
-            output.append(f"    '{sanitize_name(org_name)}/{sanitize_name(project_name)}',")
-            output.append(f"    'main',")
-            output.append(f"    'us-{['central', 'east', 'west'][project_id % 3]}1',")
-            output.append(f"    'us-{['central', 'east', 'west'][project_id % 3]}1-{chr(97 + (project_id % 3))}',")
-            output.append(f"    'e2-{['micro', 'small', 'medium', 'standard-2'][project_id % 4]}',")
-            output.append(f"    '{sanitize_name(org_name)}-{sanitize_name(project_name)}',")
-            output.append(f"    '{proj_gcp_num}',")
-            output.append(f"    'active',")
-            output.append(f"    {owner_id},")
-            output.append(f"    NOW()")
-            output.append(f");")
-            output.append("")
-
-            # Project members
-            num_proj_members = random.randint(MIN_MEMBERS_PER_RESOURCE, min(8, MAX_MEMBERS_PER_RESOURCE))
-            for proj_mem_num in range(num_proj_members):
-                if character_index >= len(all_characters):
+            proj_mem_email = f"{proj_mem_username}@{org_slug}.com"
+            proj_mem_uuid = account_uuid_for(f"bulk-{proj_mem_id}")
+            proj_mem_role = 'owner' if proj_mem_num == 0 else ('developer' if rand() < 2 / 3 else 'read')
+
+            # Create member account and add as project member
+            projmem_uuid = project_member_uuid_for(f"bulk-{project_id}-{proj_mem_id}")
+            add_account(f"({proj_mem_id}, UNHEX('{proj_mem_uuid}'), '{proj_mem_email}', '{proj_mem_name}', 'apikey', TRUE, 'entity-bulk-{proj_mem_id}', NOW())")
+            add_project_member(f"(UNHEX('{projmem_uuid}'), {project_id}, {proj_mem_id}, '{proj_mem_role}', 'active', {owner_id}, NOW())")
+
+        # Generate Sites for this project
+        for site_num, num_site_members in enumerate(site_member_counts):
+            site_name = SITE_ENVS[site_num % len(SITE_ENVS)]
+            if site_num >= len(SITE_ENVS):
+                site_name = f"{site_name}-{site_num // len(SITE_ENVS) + 1}"
+
+            site_uuid = site_uuid_for(f"bulk-{site_id}")
+            site_ip = next_site_ip()
+            site_ref = next_site_ref()
+
+            add_site(f"({site_id}, UNHEX('{site_uuid}'), {project_id}, '{site_name}', '{site_ref}', '{site_ip}', 'active', {owner_id}, NOW())")
+
+            # Site members
+            for site_mem_num in range(num_site_members):
+                if character_index >= len(ALL_CHARACTERS):
                     character_index = 0
 
-                proj_mem_first, proj_mem_last, proj_mem_username = all_characters[character_index]
+                site_mem_username, site_mem_name = ALL_CHARACTERS[character_index]
                 character_index += 1
 
-                proj_mem_id = account_id
+                site_mem_id = account_id
                 account_id += 1
 
-                proj_mem_name = f"{proj_mem_first} {proj_mem_last}".strip()
-                proj_mem_email = f"{proj_mem_username}@{sanitize_name(org_name)}.com"
-                proj_mem_uuid = generate_uuid_from_seed("acc00000", f"bulk-{proj_mem_id}")
-                proj_mem_role = 'owner' if proj_mem_num == 0 else random.choice(['developer', 'developer', 'read'])
-
-                # Create member account
-                output.append(f"INSERT INTO accounts (id, public_id, email, name, auth_method, verified, vault_entity_id, created_at)")
-                output.append(f"VALUES ({proj_mem_id}, UNHEX(REPLACE('{proj_mem_uuid}', '-', '')), '{proj_mem_email}', '{proj_mem_name}', 'apikey', TRUE, 'entity-bulk-{proj_mem_id}', NOW());")
-                output.append("")
-
-                # Add as project member
-                projmem_uuid = generate_uuid_from_seed("pr0jmem0", f"bulk-{project_id}-{proj_mem_id}")
-                output.append(f"INSERT INTO project_members (public_id, project_id, account_id, role, status, created_by, created_at)")
-                output.append(f"VALUES (UUID_TO_BIN('{projmem_uuid}'), {project_id}, {proj_mem_id}, '{proj_mem_role}', 'active', {owner_id}, NOW());")
-                output.append("")
-
-            # Generate Sites for this project
-            num_sites = random.randint(MIN_SITES_PER_PROJECT, MAX_SITES_PER_PROJECT)
-            for site_num in range(num_sites):
-                site_name = SITE_ENVS[site_num % len(SITE_ENVS)]
-                if site_num >= len(SITE_ENVS):
-                    site_name = f"{site_name}-{site_num // len(SITE_ENVS) + 1}"
-
-                site_uuid = generate_uuid_from_seed("51te0000", f"bulk-{site_id}")
-                site_ip = f"35.{random.randint(190, 250)}.{random.randint(1, 254)}.{random.randint(1, 254)}"
-
-                output.append(f"-- Site: {site_name} ({project_name})")
-                output.append(f"INSERT INTO sites (id, public_id, project_id, name, github_ref, gcp_external_ip, status, created_by, created_at)")
-                output.append(f"VALUES (")
-                output.append(f"    {site_id},")
-                output.append(f"    UNHEX(REPLACE('{site_uuid}', '-', '')),")
-                output.append(f"    {project_id},")
-                output.append(f"    '{site_name}',")
-                output.append(f"    'tags/v{random.randint(1, 5)}.{random.randint(0, 20)}.{random.randint(0, 10)}',")
-                output.append(f"    '{site_ip}',")
-                output.append(f"    'active',")
-                output.append(f"    {owner_id},")
-                output.append(f"    NOW()")
-                output.append(f");")
-                output.append("")
-
-                # Site members
-                num_site_members = random.randint(MIN_MEMBERS_PER_RESOURCE, min(6, MAX_MEMBERS_PER_RESOURCE))
-                for site_mem_num in range(num_site_members):
-                    if character_index >= len(all_characters):
-                        character_index = 0
-
-                    site_mem_first, site_mem_last, site_mem_username = all_characters[character_index]
-                    character_index += 1
-
-                    site_mem_id = account_id
-                    account_id += 1
-
-                    site_mem_name = f"{site_mem_first} {site_mem_last}".strip()
-                    site_mem_email = f"{site_mem_username}@{sanitize_name(org_name)}.com"
-                    site_mem_uuid = generate_uuid_from_seed("acc00000", f"bulk-{site_mem_id}")
-                    site_mem_role = 'owner' if site_mem_num == 0 else random.choice(['developer', 'developer', 'read'])
-
-                    # Create member account
-                    output.append(f"INSERT INTO accounts (id, public_id, email, name, auth_method, verified, vault_entity_id, created_at)")
-                    output.append(f"VALUES ({site_mem_id}, UNHEX(REPLACE('{site_mem_uuid}', '-', '')), '{site_mem_email}', '{site_mem_name}', 'apikey', TRUE, 'entity-bulk-{site_mem_id}', NOW());")
-                    output.append("")
-
-                    # Add as site member
-                    sitemem_uuid = generate_uuid_from_seed("51temem0", f"bulk-{site_id}-{site_mem_id}")
-                    output.append(f"INSERT INTO site_members (public_id, site_id, account_id, role, status, created_by, created_at)")
-                    output.append(f"VALUES (UUID_TO_BIN('{sitemem_uuid}'), {site_id}, {site_mem_id}, '{site_mem_role}', 'active', {owner_id}, NOW());")
-                    output.append("")
-
-                site_id += 1
-
-            project_id += 1
+                site_mem_email = f"{site_mem_username}@{org_slug}.com"
+                site_mem_uuid = account_uuid_for(f"bulk-{site_mem_id}")
+                site_mem_role = 'owner' if site_mem_num == 0 else ('developer' if rand() < 2 / 3 else 'read')
+
+                # Create member account and add as site member
+                sitemem_uuid = site_member_uuid_for(f"bulk-{site_id}-{site_mem_id}")
+                add_account(f"({site_mem_id}, UNHEX('{site_mem_uuid}'), '{site_mem_email}', '{site_mem_name}', 'apikey', TRUE, 'entity-bulk-{site_mem_id}', NOW())")
+                add_site_member(f"(UNHEX('{sitemem_uuid}'), {site_id}, {site_mem_id}, '{site_mem_role}', 'active', {owner_id}, NOW())")
+
+            site_id += 1
+
+        project_id += 1
+
+    for batch in batches.values():
+        batch.flush()
+
+    return output.getvalue()
+
+def main():
+    # Configuration
+    NUM_ORGS = 200
+    MIN_PROJECTS_PER_ORG = 0
+    MAX_PROJECTS_PER_ORG = 20
+    MIN_SITES_PER_PROJECT = 0
+    MAX_SITES_PER_PROJECT = 5
+    MIN_MEMBERS_PER_RESOURCE = 0
+    MAX_MEMBERS_PER_RESOURCE = 10
+    RANDOM_SEED = 0
+
+    # Seeded generator so runs are reproducible
+    rng = random.Random(RANDOM_SEED)
 
+    # Draw the shape of the whole dataset up front, one batch per category
+    org_member_counts = draw(rng, MIN_MEMBERS_PER_RESOURCE, min(5, MAX_MEMBERS_PER_RESOURCE), NUM_ORGS)
+    project_counts = draw(rng, MIN_PROJECTS_PER_ORG, MAX_PROJECTS_PER_ORG, NUM_ORGS)
+    total_projects = sum(project_counts)
+    project_member_counts = draw(rng, MIN_MEMBERS_PER_RESOURCE, min(8, MAX_MEMBERS_PER_RESOURCE), total_projects)
+    site_counts = draw(rng, MIN_SITES_PER_PROJECT, MAX_SITES_PER_PROJECT, total_projects)
+    total_sites = sum(site_counts)
+    site_member_counts = draw(rng, MIN_MEMBERS_PER_RESOURCE, min(6, MAX_MEMBERS_PER_RESOURCE), total_sites)
+
+    next_project_member_count = iter(project_member_counts).__next__
+    next_site_count = iter(site_counts).__next__
+    next_site_member_count = iter(site_member_counts).__next__
+
+    # Starting IDs
+    account_id = 100
+    org_id = 100
+    project_id = 100
+    site_id = 100
+    relationship_id = 100
+
+    # Track used characters
+    character_index = 0
+
+    # Give every org its own contiguous ID ranges so orgs can be generated independently
+    specs = []
+    for org_num in range(NUM_ORGS):
+        projects = []
+        for _ in range(project_counts[org_num]):
+            num_proj_members = next_project_member_count()
+            projects.append((num_proj_members, [next_site_member_count() for _ in range(next_site_count())]))
+
+        num_additional_members = org_member_counts[org_num]
+        specs.append(OrgSpec(
+            f"{RANDOM_SEED}-{org_num}", org_num, org_id, account_id, project_id, site_id, relationship_id,
+            character_index, num_additional_members, projects,
+        ))
+
+        num_accounts = 1 + num_additional_members + sum(
+            num_members + sum(site_members) for num_members, site_members in projects
+        )
+        account_id += num_accounts
+        character_index = (character_index + num_accounts) % len(ALL_CHARACTERS)
+        project_id += len(projects)
+        site_id += sum(len(site_members) for _, site_members in projects)
+        relationship_id += 1
         org_id += 1
-        output.append("")
 
-    # Write to file
-    with open('rbac_bulk_seed.sql', 'w') as f:
-        f.write('\n'.join(output))
+    # Stream records straight to disk instead of building the whole file in memory
+    with open('rbac_bulk_seed.sql', 'w', buffering=1 << 20) as f:
+        write = f.write
+
+        write("-- ============================================\n")
+        write("-- BULK TEST DATA - AUTO GENERATED\n")
+        write(f"-- Generated: {datetime.now().isoformat()}\n")
+        write(f"-- Organizations: {NUM_ORGS}\n")
+        write("-- ============================================\n\n")
+        write(BULK_LOAD_BEGIN)
+
+        # Orgs are independent, so generate them in parallel; imap keeps them in order
+        with Pool() as pool:
+            for org_sql in pool.imap(generate_org_sql, specs, chunksize=8):
+                write(org_sql)
+
+        write(BULK_LOAD_END)
 
     print(f"Generated bulk seed data:")
     print(f"  - {NUM_ORGS} organizations")
@@ -5,72 +5,106 @@ Generates consistent seed.sql and vault-init.sh from a single source of truth.
 """
 
 import hashlib
+import io
 import json
 import os
 import uuid
+from dataclasses import dataclass, field
+from typing import ClassVar
 
 def get_uuid(seed):
     """Generate a deterministic valid UUID from a seed string using UUIDv5."""
     return str(uuid.uuid5(uuid.NAMESPACE_DNS, seed))
 
+def get_uuid_hex(seed):
+    """Same UUID as get_uuid, as the 32 hex chars UNHEX() expects."""
+    return uuid.uuid5(uuid.NAMESPACE_DNS, seed).hex
+
 # =============================================================================
 # DATA DEFINITIONS
 # =============================================================================
 
+@dataclass(slots=True, eq=False)
 class Resource:
-    def __init__(self, name, id_seed):
-        self.name = name
-        self.id_seed = id_seed
-        self.uuid = get_uuid(id_seed)
-        # Integer ID will be assigned during processing
-        self.id = 0
+    # Derived from the subclass's raw_seed in __post_init__
+    id_seed: str = field(init=False)
+    uuid: str = field(init=False)
+    hex: str = field(init=False)
+    # Integer ID will be assigned during processing
+    id: int = field(default=0, init=False)
+
+    SEED_PREFIX: ClassVar[str] = ""
 
+    def __post_init__(self):
+        self.id_seed = self.SEED_PREFIX + self.raw_seed
+        self.uuid = get_uuid(self.id_seed)
+        self.hex = self.uuid.replace("-", "")
+
+@dataclass(slots=True, eq=False)
 class Account(Resource):
-    def __init__(self, name, email, id_seed, password="password123"):
-        super().__init__(name, "account-" + id_seed)
-        self.email = email
-        self.password = password
-        self.raw_seed = id_seed
-        self.api_keys = []
-        self.ssh_keys = []
+    name: str
+    email: str
+    raw_seed: str
+    password: str = "password123"
+    api_keys: list = field(default_factory=list, init=False)
+    ssh_keys: list = field(default_factory=list, init=False)
+
+    SEED_PREFIX: ClassVar[str] = "account-"
 
+@dataclass(slots=True, eq=False)
 class Organization(Resource):
-    def __init__(self, name, id_seed, owner, region="us-central1"):
-        super().__init__(name, "org-" + id_seed)
-        self.owner = owner
-        self.region = region
-        self.members = [] # list of (Account, role)
-        self.secrets = []
-        self.firewall_rules = []
+    name: str
+    raw_seed: str
+    owner: Account
+    region: str = "us-central1"
+    members: list = field(default_factory=list, init=False) # list of (Account, role)
+    secrets: list = field(default_factory=list, init=False)
+    firewall_rules: list = field(default_factory=list, init=False)
 
-class Project(Resource):
-    def __init__(self, name, org, id_seed, owner, region="us-central1"):
-        super().__init__(name, "proj-" + id_seed)
-        self.raw_seed = id_seed
-        self.org = org
-        self.owner = owner
-        self.region = region
-        self.members = [] # list of (Account, role)
-        self.secrets = []
-        self.firewall_rules = []
+    SEED_PREFIX: ClassVar[str] = "org-"
 
+@dataclass(slots=True, eq=False)
+class Project(Resource):
+    name: str
+    org: Organization
+    raw_seed: str
+    owner: Account
+    region: str = "us-central1"
+    members: list = field(default_factory=list, init=False) # list of (Account, role)
+    secrets: list = field(default_factory=list, init=False)
+    firewall_rules: list = field(default_factory=list, init=False)
+
+    SEED_PREFIX: ClassVar[str] = "proj-"
+
+@dataclass(slots=True, eq=False)
 class Site(Resource):
-    def __init__(self, name, project, id_seed, owner):
-        super().__init__(name, "site-" + id_seed)
-        self.project = project
-        self.owner = owner
-        self.members = [] # list of (Account, role)
-        self.secrets = []
-        self.firewall_rules = []
+    name: str
+    project: Project
+    raw_seed: str
+    owner: Account
+    members: list = field(default_factory=list, init=False) # list of (Account, role)
+    secrets: list = field(default_factory=list, init=False)
+    firewall_rules: list = field(default_factory=list, init=False)
 
+    SEED_PREFIX: ClassVar[str] = "site-"
+
+@dataclass(slots=True, eq=False)
 class APIKey:
-    def __init__(self, name, account, secret_value, id_seed, scopes=None, description=""):
-        self.name = name
-        self.account = account
-        self.secret_value = secret_value
-        self.uuid = get_uuid("apikey-" + id_seed)
-        self.scopes = scopes if scopes else []
-        self.description = description
+    name: str
+    account: Account
+    secret_value: str
+    id_seed: str
+    scopes: list = field(default_factory=list)
+    description: str = ""
+    uuid: str = field(init=False)
+    hex: str = field(init=False)
+    # Scopes are fixed once the key is built, so serialize them once
+    scope_json: str = field(init=False)
+
+    def __post_init__(self):
+        self.uuid = get_uuid("apikey-" + self.id_seed)
+        self.hex = self.uuid.replace("-", "")
+        self.scope_json = json.dumps(self.scopes)
 
 # =============================================================================
 # DATA POPULATION (The "Seinfeld" Dataset)
@@ -215,121 +249,169 @@ site_map["site-jupiter-prod"].firewall_rules.append(("Production CDN", "192.168.
 # GENERATORS
 # =============================================================================
 
+# INSERT column lists, shared by every row written to the same table
+ACCOUNT_INSERT_PREFIX = "INSERT INTO accounts (id, public_id, email, name, auth_method, verified, vault_entity_id, onboarding_completed, created_at)\n"
+API_KEY_INSERT_PREFIX = "INSERT INTO api_keys (public_id, account_id, name, description, scopes, active, created_by, created_at)\n"
+SSH_KEY_INSERT_PREFIX = "INSERT INTO ssh_keys (public_id, account_id, public_key, name, fingerprint, created_at)\n"
+ORG_INSERT_PREFIX = "INSERT INTO organizations (id, public_id, name, gcp_org_id, gcp_billing_account, gcp_parent, location, region, gcp_folder_id, status, gcp_project_id, gcp_project_number, created_by, created_at)\n"
+RELATIONSHIP_INSERT_PREFIX = "INSERT INTO relationships (id, public_id, source_organization_id, target_organization_id, relationship_type, status)\n"
+ORG_MEMBER_INSERT_PREFIX = "INSERT INTO organization_members (public_id, organization_id, account_id, role, status, created_by, created_at)\n"
+ORG_SECRET_INSERT_PREFIX = "INSERT INTO organization_secrets (public_id, organization_id, name, vault_path, status, created_at, updated_at, created_by)\n"
+ORG_FIREWALL_RULE_INSERT_PREFIX = "INSERT INTO organization_firewall_rules (public_id, organization_id, name, cidr, rule_type, status, created_at, updated_at, created_by)\n"
+PROJECT_INSERT_PREFIX = "INSERT INTO projects (id, public_id, organization_id, name, gcp_region, gcp_zone, machine_type, gcp_project_id, gcp_project_number, status, organization_project, created_by, created_at)\n"
+PROJECT_MEMBER_INSERT_PREFIX = "INSERT INTO project_members (public_id, project_id, account_id, role, status, created_by, created_at)\n"
+PROJECT_SECRET_INSERT_PREFIX = "INSERT INTO project_secrets (public_id, project_id, name, vault_path, status, created_at, updated_at, created_by)\n"
+PROJECT_FIREWALL_RULE_INSERT_PREFIX = "INSERT INTO project_firewall_rules (public_id, project_id, name, cidr, rule_type, status, created_at, updated_at, created_by)\n"
+SITE_INSERT_PREFIX = "INSERT INTO sites (id, public_id, project_id, name, github_repository, github_ref, compose_path, compose_file, port, application_type, gcp_external_ip, status, created_by, created_at)\n"
+SITE_MEMBER_INSERT_PREFIX = "INSERT INTO site_members (public_id, site_id, account_id, role, status, created_by, created_at)\n"
+SITE_SECRET_INSERT_PREFIX = "INSERT INTO site_secrets (public_id, site_id, name, vault_path, status, created_at, updated_at, created_by)\n"
+SITE_FIREWALL_RULE_INSERT_PREFIX = "INSERT INTO site_firewall_rules (public_id, site_id, name, cidr, rule_type, status, created_at, updated_at, created_by)\n"
+
+# Rows per multi-row INSERT, well under max_allowed_packet
+BATCH_SIZE = 500
+
+def write_insert(write, prefix, rows):
+    """Write rows as multi-row INSERTs, at most BATCH_SIZE rows per statement."""
+    for start in range(0, len(rows), BATCH_SIZE):
+        write(prefix)
+        write("VALUES ")
+        write(",\n".join(rows[start:start + BATCH_SIZE]))
+        write(";\n")
+
 def generate_sql():
-    lines = []
-    lines.append("-- AUTO-GENERATED SEED DATA")
-    lines.append("-- Generated by ci/testdata/generate_seed.py")
-    lines.append("")
+    buf = io.StringIO()
+    write = buf.write
+    write("-- AUTO-GENERATED SEED DATA\n")
+    write("-- Generated by ci/testdata/generate_seed.py\n")
+    write("\n")
 
     # Assign integer IDs
     acc_id_counter = 1
     for acc in accounts:
         acc.id = acc_id_counter
         acc_id_counter += 1
-        lines.append(f"-- Account: {acc.name}")
+        write(f"-- Account: {acc.name}\n")
         # Special handling: Lloyd Braun account has onboarding_completed=FALSE for e2e testing
         onboarding_completed = "FALSE" if acc.email == "lloyd.braun@vandelay.com" else "TRUE"
-        lines.append("INSERT INTO accounts (id, public_id, email, name, auth_method, verified, vault_entity_id, onboarding_completed, created_at)")
-        lines.append(f"VALUES ({acc.id}, UNHEX(REPLACE('{acc.uuid}', '-', '')), '{acc.email}', '{acc.name}', 'userpass', TRUE, 'entity-{acc.email}', {onboarding_completed}, NOW());")
-        lines.append("")
+        write(ACCOUNT_INSERT_PREFIX)
+        write(f"VALUES ({acc.id}, UNHEX('{acc.hex}'), '{acc.email}', '{acc.name}', 'userpass', TRUE, 'entity-{acc.email}', {onboarding_completed}, NOW());\n")
+        write("\n")
 
         # API Keys for Account
+        rows = []
         for key in acc.api_keys:
-            scope_json = json.dumps(key.scopes)
-            lines.append(f"INSERT INTO api_keys (public_id, account_id, name, description, scopes, active, created_by, created_at)")
-            lines.append(f"VALUES (UNHEX(REPLACE('{key.uuid}', '-', '')), {acc.id}, '{key.name}', '{key.description}', '{scope_json}', TRUE, {acc.id}, NOW());")
+            rows.append(f"(UNHEX('{key.hex}'), {acc.id}, '{key.name}', '{key.description}', '{key.scope_json}', TRUE, {acc.id}, NOW())")
+        write_insert(write, API_KEY_INSERT_PREFIX, rows)
 
         # SSH Keys
+        rows = []
         for ssh in acc.ssh_keys:
-             lines.append(f"INSERT INTO ssh_keys (public_id, account_id, public_key, name, fingerprint, created_at)")
-             lines.append(f"VALUES (UNHEX(REPLACE('{ssh['uuid']}', '-', '')), {acc.id}, '{ssh['key']}', '{ssh['name']}', '{ssh['fingerprint']}', NOW());")
+            ssh_hex = ssh['uuid'].replace('-', '')
+            rows.append(f"(UNHEX('{ssh_hex}'), {acc.id}, '{ssh['key']}', '{ssh['name']}', '{ssh['fingerprint']}', NOW())")
+        write_insert(write, SSH_KEY_INSERT_PREFIX, rows)
 
-        lines.append("")
+        write("\n")
 
     org_id_counter = 1
     for org in orgs:
         org.id = org_id_counter
         org_id_counter += 1
 
-        lines.append(f"-- Organization: {org.name}")
-        lines.append("INSERT INTO organizations (id, public_id, name, gcp_org_id, gcp_billing_account, gcp_parent, location, region, gcp_folder_id, status, gcp_project_id, gcp_project_number, created_by, created_at)")
-        lines.append(f"VALUES ({org.id}, UNHEX(REPLACE('{org.uuid}', '-', '')), '{org.name}', '1{org.id}000', 'BILL-{org.id}', 'organizations/1{org.id}000', 'us', '{org.region}', 'folders/2{org.id}000', 'active', 'org-{org.id}-proj', '3{org.id}000', {org.owner.id}, NOW());")
-        lines.append("")
+        write(f"-- Organization: {org.name}\n")
+        write(ORG_INSERT_PREFIX)
+        write(f"VALUES ({org.id}, UNHEX('{org.hex}'), '{org.name}', '1{org.id}000', 'BILL-{org.id}', 'organizations/1{org.id}000', 'us', '{org.region}', 'folders/2{org.id}000', 'active', 'org-{org.id}-proj', '3{org.id}000', {org.owner.id}, NOW());\n")
+        write("\n")
 
         # Relationships (hardcoded for now to link all to LibOps if not LibOps)
         if org.id_seed != "org-libops":
-            rel_uuid = get_uuid(f"rel-libops-{org.id_seed}")
-            lines.append(f"INSERT INTO relationships (id, public_id, source_organization_id, target_organization_id, relationship_type, status)")
-            lines.append(f"VALUES ({org.id}, UNHEX(REPLACE('{rel_uuid}', '-', '')), 1, {org.id}, 'access', 'approved');")
-            lines.append("")
+            rel_hex = get_uuid_hex(f"rel-libops-{org.id_seed}")
+            write(RELATIONSHIP_INSERT_PREFIX)
+            write(f"VALUES ({org.id}, UNHEX('{rel_hex}'), 1, {org.id}, 'access', 'approved');\n")
+            write("\n")
 
+        rows = []
         for member, role in org.members:
-            mem_uuid = get_uuid(f"orgmem-{org.id_seed}-{member.raw_seed}")
-            lines.append(f"INSERT INTO organization_members (public_id, organization_id, account_id, role, status, created_by, created_at)")
-            lines.append(f"VALUES (UNHEX(REPLACE('{mem_uuid}', '-', '')), {org.id}, {member.id}, '{role}', 'active', {org.owner.id}, NOW());")
+            mem_hex = get_uuid_hex(f"orgmem-{org.id_seed}-{member.raw_seed}")
+            rows.append(f"(UNHEX('{mem_hex}'), {org.id}, {member.id}, '{role}', 'active', {org.owner.id}, NOW())")
+        write_insert(write, ORG_MEMBER_INSERT_PREFIX, rows)
 
+        rows = []
         for name, uuid in org.secrets:
-             lines.append(f"INSERT INTO organization_secrets (public_id, organization_id, name, vault_path, status, created_at, updated_at, created_by)")
-             lines.append(f"VALUES (UNHEX(REPLACE('{uuid}', '-', '')), {org.id}, '{name}', 'secret-organization/{org.id}/{name}', 'active', UNIX_TIMESTAMP(), UNIX_TIMESTAMP(), {org.owner.id});")
+            uuid_hex = uuid.replace("-", "")
+            rows.append(f"(UNHEX('{uuid_hex}'), {org.id}, '{name}', 'secret-organization/{org.id}/{name}', 'active', UNIX_TIMESTAMP(), UNIX_TIMESTAMP(), {org.owner.id})")
+        write_insert(write, ORG_SECRET_INSERT_PREFIX, rows)
 
+        rows = []
         for name, cidr, uuid in org.firewall_rules:
-             lines.append(f"INSERT INTO organization_firewall_rules (public_id, organization_id, name, cidr, rule_type, status, created_at, updated_at, created_by)")
-             lines.append(f"VALUES (UNHEX(REPLACE('{uuid}', '-', '')), {org.id}, '{name}', '{cidr}', 'https_allowed', 'active', NOW(), NOW(), {org.owner.id});")
-        lines.append("")
+            uuid_hex = uuid.replace("-", "")
+            rows.append(f"(UNHEX('{uuid_hex}'), {org.id}, '{name}', '{cidr}', 'https_allowed', 'active', NOW(), NOW(), {org.owner.id})")
+        write_insert(write, ORG_FIREWALL_RULE_INSERT_PREFIX, rows)
+        write("\n")
 
     proj_id_counter = 1
     for proj in projects:
         proj.id = proj_id_counter
         proj_id_counter += 1
 
-        lines.append(f"-- Project: {proj.name}")
-        lines.append("INSERT INTO projects (id, public_id, organization_id, name, gcp_region, gcp_zone, machine_type, gcp_project_id, gcp_project_number, status, organization_project, created_by, created_at)")
-        lines.append(f"VALUES ({proj.id}, UNHEX(REPLACE('{proj.uuid}', '-', '')), {proj.org.id}, '{proj.name}', '{proj.region}', '{proj.region}-b', 'e2-medium', 'proj-{proj.id}-gcp', '4{proj.id}000', 'active', TRUE, {proj.owner.id}, NOW());")
-        lines.append("")
+        write(f"-- Project: {proj.name}\n")
+        write(PROJECT_INSERT_PREFIX)
+        write(f"VALUES ({proj.id}, UNHEX('{proj.hex}'), {proj.org.id}, '{proj.name}', '{proj.region}', '{proj.region}-b', 'e2-medium', 'proj-{proj.id}-gcp', '4{proj.id}000', 'active', TRUE, {proj.owner.id}, NOW());\n")
+        write("\n")
 
+        rows = []
         for member, role in proj.members:
-            mem_uuid = get_uuid(f"projmem-{proj.id_seed}-{member.raw_seed}")
-            lines.append(f"INSERT INTO project_members (public_id, project_id, account_id, role, status, created_by, created_at)")
-            lines.append(f"VALUES (UNHEX(REPLACE('{mem_uuid}', '-', '')), {proj.id}, {member.id}, '{role}', 'active', {proj.owner.id}, NOW());")
+            mem_hex = get_uuid_hex(f"projmem-{proj.id_seed}-{member.raw_seed}")
+            rows.append(f"(UNHEX('{mem_hex}'), {proj.id}, {member.id}, '{role}', 'active', {proj.owner.id}, NOW())")
+        write_insert(write, PROJECT_MEMBER_INSERT_PREFIX, rows)
 
+        rows = []
         for name, uuid in proj.secrets:
-             lines.append(f"INSERT INTO project_secrets (public_id, project_id, name, vault_path, status, created_at, updated_at, created_by)")
-             lines.append(f"VALUES (UNHEX(REPLACE('{uuid}', '-', '')), {proj.id}, '{name}', 'secret-project/{proj.id}/{name}', 'active', UNIX_TIMESTAMP(), UNIX_TIMESTAMP(), {proj.owner.id});")
+            uuid_hex = uuid.replace("-", "")
+            rows.append(f"(UNHEX('{uuid_hex}'), {proj.id}, '{name}', 'secret-project/{proj.id}/{name}', 'active', UNIX_TIMESTAMP(), UNIX_TIMESTAMP(), {proj.owner.id})")
+        write_insert(write, PROJECT_SECRET_INSERT_PREFIX, rows)
 
+        rows = []
         for name, cidr, uuid in proj.firewall_rules:
-             lines.append(f"INSERT INTO project_firewall_rules (public_id, project_id, name, cidr, rule_type, status, created_at, updated_at, created_by)")
-             lines.append(f"VALUES (UNHEX(REPLACE('{uuid}', '-', '')), {proj.id}, '{name}', '{cidr}', 'https_allowed', 'active', NOW(), NOW(), {proj.owner.id});")
-        lines.append("")
+            uuid_hex = uuid.replace("-", "")
+            rows.append(f"(UNHEX('{uuid_hex}'), {proj.id}, '{name}', '{cidr}', 'https_allowed', 'active', NOW(), NOW(), {proj.owner.id})")
+        write_insert(write, PROJECT_FIREWALL_RULE_INSERT_PREFIX, rows)
+        write("\n")
 
     site_id_counter = 1
     for site in sites:
         site.id = site_id_counter
         site_id_counter += 1
 
-        lines.append(f"-- Site: {site.name}")
-        lines.append("INSERT INTO sites (id, public_id, project_id, name, github_repository, github_ref, compose_path, compose_file, port, application_type, gcp_external_ip, status, created_by, created_at)")
-        lines.append(f"VALUES ({site.id}, UNHEX(REPLACE('{site.uuid}', '-', '')), {site.project.id}, '{site.name}', 'repo/{site.project.raw_seed}', 'main', '', 'docker-compose.yml', 80, 'generic', '1.2.3.{site.id}', 'active', {site.owner.id}, NOW());")
-        lines.append("")
+        write(f"-- Site: {site.name}\n")
+        write(SITE_INSERT_PREFIX)
+        write(f"VALUES ({site.id}, UNHEX('{site.hex}'), {site.project.id}, '{site.name}', 'repo/{site.project.raw_seed}', 'main', '', 'docker-compose.yml', 80, 'generic', '1.2.3.{site.id}', 'active', {site.owner.id}, NOW());\n")
+        write("\n")
 
+        rows = []
         for member, role in site.members:
-            mem_uuid = get_uuid(f"sitemem-{site.id_seed}-{member.raw_seed}")
-            lines.append(f"INSERT INTO site_members (public_id, site_id, account_id, role, status, created_by, created_at)")
-            lines.append(f"VALUES (UNHEX(REPLACE('{mem_uuid}', '-', '')), {site.id}, {member.id}, '{role}', 'active', {site.owner.id}, NOW());")
+            mem_hex = get_uuid_hex(f"sitemem-{site.id_seed}-{member.raw_seed}")
+            rows.append(f"(UNHEX('{mem_hex}'), {site.id}, {member.id}, '{role}', 'active', {site.owner.id}, NOW())")
+        write_insert(write, SITE_MEMBER_INSERT_PREFIX, rows)
 
+        rows = []
         for name, uuid in site.secrets:
-             lines.append(f"INSERT INTO site_secrets (public_id, site_id, name, vault_path, status, created_at, updated_at, created_by)")
-             lines.append(f"VALUES (UNHEX(REPLACE('{uuid}', '-', '')), {site.id}, '{name}', 'secret-site/{site.id}/{name}', 'active', UNIX_TIMESTAMP(), UNIX_TIMESTAMP(), {site.owner.id});")
+            uuid_hex = uuid.replace("-", "")
+            rows.append(f"(UNHEX('{uuid_hex}'), {site.id}, '{name}', 'secret-site/{site.id}/{name}', 'active', UNIX_TIMESTAMP(), UNIX_TIMESTAMP(), {site.owner.id})")
+        write_insert(write, SITE_SECRET_INSERT_PREFIX, rows)
 
+        rows = []
         for name, cidr, uuid in site.firewall_rules:
-             lines.append(f"INSERT INTO site_firewall_rules (public_id, site_id, name, cidr, rule_type, status, created_at, updated_at, created_by)")
-             lines.append(f"VALUES (UNHEX(REPLACE('{uuid}', '-', '')), {site.id}, '{name}', '{cidr}', 'https_allowed', 'active', NOW(), NOW(), {site.owner.id});")
+            uuid_hex = uuid.replace("-", "")
+            rows.append(f"(UNHEX('{uuid_hex}'), {site.id}, '{name}', '{cidr}', 'https_allowed', 'active', NOW(), NOW(), {site.owner.id})")
+        write_insert(write, SITE_FIREWALL_RULE_INSERT_PREFIX, rows)
 
-        lines.append("")
+        write("\n")
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 def generate_vault_init():
-    lines = []
+    buf = io.StringIO()
+    write = buf.write
     api_policy = ""
     with open('./conf/init/policies/api.hcl', 'r') as f:
         api_policy = f.read()
@@ -338,17 +420,18 @@ def generate_vault_init():
     with open('./conf/init/policies/libops-user.hcl', 'r') as f:
         user_policy = f.read()
 
-    lines.append("#!/usr/bin/env bash")
-    lines.append("set -eou pipefail")
-    lines.append('echo "Initializing Vault with AUTO-GENERATED data..."')
-    lines.append("")
+    write("#!/usr/bin/env bash\n")
+    write("set -eou pipefail\n")
+    write('echo "Initializing Vault with AUTO-GENERATED data..."\n')
+    write("\n")
 
     # Common setup
-    lines.append("""
-# Helper to enable secrets engine if not already enabled
+    write("""
+# Helper to enable secrets engine if not already enabled. Checks the
+# listing cached in _SECRETS_LIST instead of asking Vault every time.
 enable_secrets() {
     path=$1
-    if vault secrets list | grep -q \"^$path/\" ; then
+    if echo "$_SECRETS_LIST" | grep -q \"^$path/\" ; then
         echo "Secrets engine at $path/ already enabled"
     else
         vault secrets enable -path=$path -version=1 kv
@@ -364,13 +447,16 @@ vault write auth/token/roles/entity-token \
     renewable=true \
     token_type="service"
 
+# List the mounted secrets engines once; each path below is only checked once
+_SECRETS_LIST=$(vault secrets list)
+
 # Enable KV v2 secrets engine for organization secrets
 enable_secrets \"secret-organization\"
 enable_secrets \"secret-project\"
 enable_secrets \"secret-site\"
 
 # Enable KV v1 secrets engine for API keys (application expects v1 at 'keys/')
-if vault secrets list | grep -q \"^keys/\" ; then
+if echo "$_SECRETS_LIST" | grep -q \"^keys/\" ; then
     echo "Secrets engine at keys/ already enabled"
 else
     vault secrets enable -path=keys -version=1 kv
@@ -378,12 +464,16 @@ else
 fi
 
 # Enable userpass auth method
-if vault auth list | grep -q \"^userpass/\" ; then
+_AUTH_LIST=$(vault auth list)
+if echo "$_AUTH_LIST" | grep -q \"^userpass/\" ; then
     echo "Auth method userpass/ already enabled"
 else
     vault auth enable userpass
     echo "Enabled userpass auth method"
+    _AUTH_LIST=$(vault auth list)
 fi
+# Every user alias points at the same userpass mount, so look its accessor up once
+_USERPASS_ACCESSOR=$(echo "$_AUTH_LIST" | grep "^userpass/" | awk '{print $3}')
 
 # Configure OIDC Provider
 echo "Configuring OIDC Provider..."
@@ -393,14 +483,18 @@ vault write identity/oidc/provider/libops-api allowed_client_ids='*' scopes='ope
 vault write identity/oidc/role/libops-api key='libops-api' template='{\"account_id\": {{identity.entity.metadata.account_id}},\"email\": {{identity.entity.metadata.email}},\"name\": {{identity.entity.name}}}' ttl='1h'
 
 # Create libops-user policy
-vault policy write libops-user - <<EOF""")
-    lines.append(user_policy)
-    lines.append("""
+vault policy write libops-user - <<EOF
+""")
+    write(user_policy)
+    write("\n")
+    write("""
 EOF
 
-vault policy write api - <<EOF""")
-    lines.append(api_policy)
-    lines.append("""
+vault policy write api - <<EOF
+""")
+    write(api_policy)
+    write("\n")
+    write("""
 path "secret-organization/*" {
   capabilities = ["create", "update", "read", "delete", "list"]
 }
@@ -426,41 +520,41 @@ create_test_user() {
     vault write "auth/userpass/users/$vault_username" password="$password" policies="libops-user"
     vault write identity/entity name="$entity_name" metadata="email=$email" metadata="account_id=$account_id" metadata="account_uuid=$account_uuid_no_dashes"
     entity_id=$(vault read -field=id identity/entity/name/$entity_name)
-    accessor=$(vault auth list | grep "^userpass/" | awk '{print $3}')
-    vault write identity/entity-alias name="$vault_username" canonical_id="$entity_id" mount_accessor=$accessor
+    vault write identity/entity-alias name="$vault_username" canonical_id="$entity_id" mount_accessor=$_USERPASS_ACCESSOR
     echo "Created user: $vault_username ($entity_id)"
 }
+
 """)
 
-    lines.append("echo 'Creating users...'")
-    for acc in accounts:
-        acc_id = accounts.index(acc) + 1
-        lines.append(f'create_test_user "{acc.email}" "{acc.password}" "{acc_id}" "entity-{acc.email}" "{acc.uuid}"')
-
-    lines.append("""echo 'Creating API keys with format: libops_{accountUUID_no_dashes}_{keyUUID_no_dashes}_{randomSecret}...'
-# Helper function to create API key in new format
-create_api_key() {
-  local account_uuid=$1
-  local key_uuid=$2
-  local random_secret=$3
-  # Strip dashes and convert to lowercase for UUIDs
-  local account_no_dashes=$(echo "$account_uuid" | tr -d '-' | tr '[:upper:]' '[:lower:]')
-  local key_no_dashes=$(echo "$key_uuid" | tr -d '-' | tr '[:upper:]' '[:lower:]')
-  # Format: libops_{accountUUID}_{keyUUID}_{randomSecret}
-  local full_key="libops_${account_no_dashes}_${key_no_dashes}_${random_secret}"
-  # Store in Vault at keys/{accountUUID}/{keyUUID} with the random secret as the value
-  vault write keys/"${account_no_dashes}/${key_no_dashes}" secret="$random_secret"
-  echo "$full_key"
-}""")
-    lines.append("echo 'Creating API keys...'")
+    write("echo 'Creating users...'\n")
+    for acc_id, acc in enumerate(accounts, start=1):
+        write(f'create_test_user "{acc.email}" "{acc.password}" "{acc_id}" "entity-{acc.email}" "{acc.uuid}"\n')
+
+    write("""echo 'Creating API keys with format: libops_{accountUUID_no_dashes}_{keyUUID_no_dashes}_{randomSecret}...'
+# Helper to create API keys in new format. Reads one
+# "{accountUUID} {keyUUID} {randomSecret}" line per key, with the UUIDs already
+# lowercase and without dashes. The keys are independent, so 8 writes run at a time.
+create_api_keys() {
+  xargs -n 3 -P 8 sh -c '
+    # Store in Vault at keys/{accountUUID}/{keyUUID} with the random secret as the value,
+    # then print it as libops_{accountUUID}_{keyUUID}_{randomSecret}. Chained with &&
+    # so a failed write fails this sh, which makes xargs exit non-zero and trips set -e
+    vault write keys/"$1/$2" secret="$3" &&
+      echo "libops_$1_$2_$3"
+  ' sh
+}
+""")
+    write("echo 'Creating API keys...'\n")
+    write("create_api_keys <<'KEYS'\n")
     for acc in accounts:
         for key in acc.api_keys:
-            lines.append(f'create_api_key "{acc.uuid}" "{key.uuid}" "{key.secret_value}"')
+            write(f"{acc.hex} {key.hex} {key.secret_value}\n")
+    write("KEYS\n")
 
-    lines.append("")
-    lines.append("echo 'Vault initialization complete!'")
+    write("\n")
+    write("echo 'Vault initialization complete!'")
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 # =============================================================================
@@ -0,0 +1,80 @@
+"""
+Shared OpenAPI spec loading and saving for the proto doc scripts.
+
+Parsing openapi.yaml dominates these scripts, so every parse is cached in a
+JSON sidecar next to the YAML and reused while it is at least as new.
+"""
+
+import json
+import os
+from pathlib import Path
+
+import yaml
+
+# Prefer libyaml's C loader; fall back to the pure-Python one when it isn't built
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# Always dump with the pure-Python emitter: libyaml folds long quoted scalars
+# differently, which would reformat the committed openapi.yaml
+from yaml import SafeDumper
+
+# orjson reads and writes the sidecar several times faster than the stdlib json module when it's installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def sidecar_path(openapi_file: Path) -> Path:
+    """Path of the JSON cache kept next to an OpenAPI YAML file."""
+    return openapi_file.with_name(openapi_file.name + '.json')
+
+
+def _write_sidecar(spec: dict, openapi_file: Path):
+    """Write the JSON cache atomically, so a reader never sees a partial file."""
+    cache_file = sidecar_path(openapi_file)
+    tmp_file = cache_file.with_name(cache_file.name + '.tmp')
+    if orjson is not None:
+        with open(tmp_file, 'wb') as f:
+            f.write(orjson.dumps(spec))
+    else:
+        with open(tmp_file, 'w') as f:
+            json.dump(spec, f)
+    os.replace(tmp_file, cache_file)
+
+
+def load_spec(openapi_file: Path) -> dict:
+    """Load an OpenAPI spec, from the JSON sidecar when it is up to date."""
+    openapi_file = Path(openapi_file)
+    cache_file = sidecar_path(openapi_file)
+
+    try:
+        if cache_file.stat().st_mtime_ns >= openapi_file.stat().st_mtime_ns:
+            cached = cache_file.read_bytes()
+            return orjson.loads(cached) if orjson is not None else json.loads(cached)
+    except FileNotFoundError:
+        pass
+
+    with open(openapi_file, 'rb') as f:
+        spec = yaml.load(f, Loader=SafeLoader)
+
+    try:
+        _write_sidecar(spec, openapi_file)
+    except OSError:
+        # The sidecar is only a cache; loading still works from a read-only checkout
+        pass
+    return spec
+
+
+def dump_spec(spec: dict, openapi_file: Path):
+    """Write an OpenAPI spec as YAML and refresh its JSON sidecar."""
+    openapi_file = Path(openapi_file)
+
+    with open(openapi_file, 'w') as f:
+        yaml.dump(spec, f, Dumper=SafeDumper, default_flow_style=False, sort_keys=False)
+
+    # Written after the YAML, so the sidecar's mtime marks it as current
+    _write_sidecar(spec, openapi_file)
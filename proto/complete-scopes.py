@@ -73,24 +73,10 @@ METHOD_SCOPES = {
 }
 
 
-def add_scope_to_rpc(content: str, method_name: str, resource: str, level: str, oauth_scopes: list) -> str:
-    """Add required_scope to an RPC method that doesn't have it."""
-
-    # Pattern to find the RPC method block
-    pattern = rf'(  rpc {method_name}\([^)]+\) returns \([^)]+\) \{{)(.*?)(^\  \}})'
-
-    def replace_func(match):
-        rpc_start = match.group(1)
-        rpc_body = match.group(2)
-        rpc_end = match.group(3)
-
-        # Check if already has required_scope
-        if 'required_scope' in rpc_body:
-            return match.group(0)
-
-        # Build scope annotation
-        oauth_lines = '\n'.join(f'      oauth_scopes: "{scope}"' for scope in oauth_scopes)
-        scope_annotation = f'''    option (libops.v1.options.required_scope) = {{
+def build_scope_annotation(resource: str, level: str, oauth_scopes: list) -> str:
+    """Build the required_scope option block for one RPC method."""
+    oauth_lines = '\n'.join(f'      oauth_scopes: "{scope}"' for scope in oauth_scopes)
+    return f'''    option (libops.v1.options.required_scope) = {{
       resource: {resource}
       level: {level}
       allow_parent_access: true
@@ -98,9 +84,41 @@ def add_scope_to_rpc(content: str, method_name: str, resource: str, level: str,
     }};
 '''
 
-        return f"{rpc_start}{rpc_body}{scope_annotation}{rpc_end}"
 
-    return re.sub(pattern, replace_func, content, flags=re.DOTALL | re.MULTILINE)
+# The annotation for each method only depends on METHOD_SCOPES, so build them all once
+SCOPE_ANNOTATIONS = {
+    method_name: build_scope_annotation(*scope)
+    for method_name, scope in METHOD_SCOPES.items()
+}
+
+# One pattern for every method in METHOD_SCOPES, so each file is scanned once
+RPC_PATTERN = re.compile(
+    rf'(  rpc ({"|".join(map(re.escape, METHOD_SCOPES))})\([^)]+\) returns \([^)]+\) \{{)(.*?)(^\  \}})',
+    re.DOTALL | re.MULTILINE,
+)
+
+# Just the names of the RPCs declared in a file
+RPC_NAME_PATTERN = re.compile(r'\brpc (\w+)\(')
+
+
+def add_scopes_to_rpcs(content: str) -> tuple[str, list]:
+    """Add required_scope to every known RPC method that doesn't have it.
+
+    Returns the new content and the names of the methods that were changed.
+    """
+    added = []
+
+    def replace_func(match: re.Match) -> str:
+        rpc_start, method_name, rpc_body, rpc_end = match.groups()
+
+        # Check if already has required_scope
+        if 'required_scope' in rpc_body:
+            return match.group(0)
+
+        added.append(method_name)
+        return f"{rpc_start}{rpc_body}{SCOPE_ANNOTATIONS[method_name]}{rpc_end}"
+
+    return RPC_PATTERN.sub(replace_func, content), added
 
 
 def process_file(filepath: Path):
@@ -108,24 +126,19 @@ def process_file(filepath: Path):
     with open(filepath, 'r') as f:
         content = f.read()
 
-    original_content = content
-    changes = 0
+    # A cheap name scan first, so files without any known method skip the block regex
+    if METHOD_SCOPES.keys().isdisjoint(RPC_NAME_PATTERN.findall(content)):
+        return 0
 
-    # Find which methods are in this file
-    for method_name, (resource, level, oauth_scopes) in METHOD_SCOPES.items():
-        if f'rpc {method_name}' in content:
-            new_content = add_scope_to_rpc(content, method_name, resource, level, oauth_scopes)
-            if new_content != content:
-                content = new_content
-                changes += 1
-                print(f"  + Added scope to {method_name}")
+    content, added = add_scopes_to_rpcs(content)
+    for method_name in added:
+        print(f"  + Added scope to {method_name}")
 
-    if content != original_content:
+    if added:
         with open(filepath, 'w') as f:
             f.write(content)
-        return changes
 
-    return 0
+    return len(added)
 
 
 def main():
@@ -3,19 +3,34 @@
 Generate Mintlify MDX files for all API endpoints from OpenAPI spec.
 """
 
-import yaml
+import os
+import re
+import sys
 import json
+from bisect import insort
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Tuple
 
+from _spec_io import load_spec
+
+# orjson is optional; without it docs.json is read and written with the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Runs of capitals in a method name, each of which starts a new snake_case word
+_CAMEL_RE = re.compile(r'([A-Z]+)')
+
 
 def parse_openapi_spec(openapi_file: Path) -> List[Tuple[str, str, str, str]]:
     """
     Parse OpenAPI spec and return list of (method, path, operation_id, summary).
     Deduplicates endpoints by preferring GET over POST when both exist.
     """
-    with open(openapi_file, 'r') as f:
-        spec = yaml.safe_load(f)
+    spec = load_spec(openapi_file)
 
     endpoints_dict = {}
 
@@ -43,61 +58,55 @@ def operation_id_to_filename(operation_id: str) -> str:
     Convert ConnectRPC operation ID to filename.
     Format: libops.v1.AccountService.CreateApiKey -> create_api_key
     """
-    import re
-
     # Extract method name from operation ID
     parts = operation_id.split('.')
     method_name = parts[-1]
 
     # Convert camelCase to snake_case
-    filename = re.sub('([A-Z]+)', r'_\1', method_name).lower()
+    filename = _CAMEL_RE.sub(r'_\1', method_name).lower()
     return filename.lstrip('_')
 
 
-def categorize_endpoint(path: str, operation_id: str) -> Tuple[str, str]:
+# Group and subgroup for each service; subgroup is None for top-level pages
+SERVICE_CATEGORY = {
+    'OrganizationService': ('Organizations', None),
+    'ProjectService': ('Projects', None),
+    'SiteService': ('Sites', None),
+    'FirewallService': ('Firewall', 'Organization Firewall'),
+    'ProjectFirewallService': ('Firewall', 'Project Firewall'),
+    'SiteFirewallService': ('Firewall', 'Site Firewall'),
+    'MemberService': ('Members', 'Organization Members'),
+    'ProjectMemberService': ('Members', 'Project Members'),
+    'SiteMemberService': ('Members', 'Site Members'),
+    'OrganizationSecretService': ('Secrets', 'Organization Secrets'),
+    'ProjectSecretService': ('Secrets', 'Project Secrets'),
+    'SiteSecretService': ('Secrets', 'Site Secrets'),
+    'SshKeyService': ('SSH Keys', None),
+    'AccountService': ('Account', None),
+    'SiteOperationsService': ('Site Operations', None),
+}
+
+
+def categorize_endpoint(path: str) -> Tuple[str, str]:
     """
     Categorize ConnectRPC endpoint into group and subgroup.
     Path format: /libops.v1.ServiceName/MethodName
     Returns: (group, subgroup) where subgroup can be None
     """
-    service_path = path.split('/')[1]
-    service_name = service_path.split('.')[-1]
-
-    if service_name == 'OrganizationService':
-        return ('Organizations', None)
-    elif service_name == 'ProjectService':
-        return ('Projects', None)
-    elif service_name == 'SiteService':
-        return ('Sites', None)
-    elif service_name == 'FirewallService':
-        return ('Firewall', 'Organization Firewall')
-    elif service_name == 'ProjectFirewallService':
-        return ('Firewall', 'Project Firewall')
-    elif service_name == 'SiteFirewallService':
-        return ('Firewall', 'Site Firewall')
-    elif service_name == 'MemberService':
-        return ('Members', 'Organization Members')
-    elif service_name == 'ProjectMemberService':
-        return ('Members', 'Project Members')
-    elif service_name == 'SiteMemberService':
-        return ('Members', 'Site Members')
-    elif service_name == 'OrganizationSecretService':
-        return ('Secrets', 'Organization Secrets')
-    elif service_name == 'ProjectSecretService':
-        return ('Secrets', 'Project Secrets')
-    elif service_name == 'SiteSecretService':
-        return ('Secrets', 'Site Secrets')
-    elif service_name == 'SshKeyService':
-        return ('SSH Keys', None)
-    elif service_name == 'AccountService':
-        return ('Account', None)
-    elif service_name == 'SiteOperationsService':
-        return ('Site Operations', None)
-    elif service_name.startswith('Admin'):
+    # One bounded split for the service segment, then take its last dotted part
+    return _categorize_service(path.split('/', 2)[1].rpartition('.')[2])
+
+
+@lru_cache(maxsize=None)
+def _categorize_service(service_name: str) -> Tuple[str, str]:
+    """(group, subgroup) for a service; every method of a service shares it."""
+    category = SERVICE_CATEGORY.get(service_name)
+    if category is not None:
+        return category
+    if service_name.startswith('Admin'):
         base_service = service_name.replace('Admin', '')
         return (f'Admin {base_service.replace("Service", "")}', None)
-    else:
-        return (service_name.replace('Service', ''), None)
+    return (service_name.replace('Service', ''), None)
 
 
 def generate_mdx_file(method: str, path: str, summary: str, output_dir: Path, filename: str):
@@ -110,33 +119,36 @@ openapi: '{method} {path}'
 ---
 """
 
+    # Write the encoded bytes straight to the fd, skipping the text-file wrapper
     output_file = output_dir / f"{filename}.mdx"
-    with open(output_file, 'w') as f:
-        f.write(content)
+    fd = os.open(output_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, content.encode('utf-8'))
+    finally:
+        os.close(fd)
 
     return output_file
 
 
-def build_navigation_structure(endpoints: List[Tuple[str, str, str, str]]) -> Dict:
-    """Build navigation structure for docs.json."""
+def build_navigation_structure(endpoints: List[Tuple[str, str, str, str, str]]) -> Dict:
+    """
+    Build navigation structure for docs.json.
+    Takes (method, path, operation_id, summary, filename) for each endpoint.
+    """
     groups = {}
 
-    for method, path, operation_id, summary in endpoints:
-        group, subgroup = categorize_endpoint(path, operation_id)
-        filename = operation_id_to_filename(operation_id)
+    for method, path, operation_id, summary, filename in endpoints:
+        group, subgroup = categorize_endpoint(path)
         page_path = f"api/reference/{filename}"
 
         if group not in groups:
-            groups[group] = {}
+            groups[group] = {'subgroups': {}, 'main': []}
 
+        # Keep every page list sorted as it is built, so nothing needs re-sorting below
         if subgroup:
-            if subgroup not in groups[group]:
-                groups[group][subgroup] = []
-            groups[group][subgroup].append(page_path)
+            insort(groups[group]['subgroups'].setdefault(subgroup, []), page_path)
         else:
-            if '__main__' not in groups[group]:
-                groups[group]['__main__'] = []
-            groups[group]['__main__'].append(page_path)
+            insort(groups[group]['main'], page_path)
 
     nav_groups = []
     nav_groups.append({
@@ -161,31 +173,25 @@ def build_navigation_structure(endpoints: List[Tuple[str, str, str, str]]) -> Di
             continue
 
         group_data = groups[group_name]
-        has_subgroups = any(k != '__main__' for k in group_data.keys())
+        subgroups = group_data['subgroups']
 
-        if has_subgroups:
-            subgroup_pages = []
-            for subgroup_name, pages in sorted(group_data.items()):
-                if subgroup_name == '__main__':
-                    continue
+        if subgroups:
+            # Top-level pages come first, followed by the subgroups
+            subgroup_pages = list(group_data['main'])
+            for subgroup_name in sorted(subgroups):
                 subgroup_pages.append({
                     "group": subgroup_name,
-                    "pages": sorted(pages)
+                    "pages": subgroups[subgroup_name]
                 })
 
-            if '__main__' in group_data:
-                for page in sorted(group_data['__main__']):
-                    subgroup_pages.insert(0, page)
-
             nav_groups.append({
                 "group": group_name,
                 "pages": subgroup_pages
             })
         else:
-            pages = group_data.get('__main__', [])
             nav_groups.append({
                 "group": group_name,
-                "pages": sorted(pages)
+                "pages": group_data['main']
             })
 
     return nav_groups
@@ -204,13 +210,25 @@ def main():
     endpoints = parse_openapi_spec(openapi_file)
     print(f"Found {len(endpoints)} endpoints")
 
+    # Work out each endpoint's filename once; the pages and the nav both use it
+    endpoints = [
+        (method, path, operation_id, summary, operation_id_to_filename(operation_id))
+        for method, path, operation_id, summary in endpoints
+    ]
+
     print("\nGenerating MDX files...")
-    generated_files = []
-    for method, path, operation_id, summary in endpoints:
-        filename = operation_id_to_filename(operation_id)
-        output_file = generate_mdx_file(method, path, summary, output_dir, filename)
-        generated_files.append(output_file)
-        print(f"  ✓ {filename}.mdx")
+    # Endpoints that map to the same filename overwrite each other, so only the last one is written
+    pages = {}
+    for method, path, operation_id, summary, filename in endpoints:
+        pages[filename] = (method, path, summary, output_dir, filename)
+
+    # Every page is its own file, so overlap the writes; os.write releases the GIL
+    with ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 2) as executor:
+        list(executor.map(lambda page: generate_mdx_file(*page), pages.values()))
+
+    # Report every page in one stdout write rather than one print per page
+    generated_files = [output_dir / f"{filename}.mdx" for *_, filename in endpoints]
+    sys.stdout.write("".join(f"  ✓ {output_file.name}\n" for output_file in generated_files))
 
     print(f"\n✓ Generated {len(generated_files)} MDX files")
 
@@ -218,16 +236,20 @@ def main():
     nav_groups = build_navigation_structure(endpoints)
 
     print("Updating docs.json...")
-    with open(docs_json, 'r') as f:
-        docs_config = json.load(f)
+    docs_bytes = docs_json.read_bytes()
+    docs_config = orjson.loads(docs_bytes) if orjson is not None else json.loads(docs_bytes)
 
     for tab in docs_config['navigation']['tabs']:
         if tab.get('tab') == 'API reference':
             tab['groups'] = nav_groups
             break
 
-    with open(docs_json, 'w') as f:
-        json.dump(docs_config, f, indent=2)
+    if orjson is not None:
+        docs_json.write_bytes(orjson.dumps(docs_config, option=orjson.OPT_INDENT_2))
+    else:
+        # Same bytes orjson writes: 2-space indent, UTF-8 rather than \u escapes
+        with open(docs_json, 'w', encoding='utf-8') as f:
+            json.dump(docs_config, f, indent=2, ensure_ascii=False)
 
     print("✓ Updated docs.json")
     print(f"\n✅ Complete! Generated {len(generated_files)} endpoint docs")
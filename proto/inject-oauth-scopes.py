@@ -9,11 +9,13 @@ This script:
 4. Adds OAuth2 security scheme definitions
 """
 
-import yaml
 import re
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Set, Optional, Tuple
+from typing import Dict, Iterator, List, Set, Optional, Tuple
+
+from _spec_io import load_spec, dump_spec
 
 # Mapping from proto scope resource+level to OAuth scope strings
 # This follows the OAuth scopes documented in SCOPES.md
@@ -78,6 +80,79 @@ SCOPE_DESCRIPTIONS = {
     'admin:system': 'Full system administrative access',
 }
 
+# Proto patterns, compiled once and shared by every file and method.
+# They run on the raw file bytes; only the captured identifiers are decoded.
+_PACKAGE_RE = re.compile(rb'package\s+([\w.]+)\s*;')
+_SERVICE_RE = re.compile(rb'service\s+(\w+)\s*\{')
+# Matches rpc METHOD_NAME (Req) returns (Res) { up to the opening brace of the method's options
+_RPC_RE = re.compile(rb'rpc\s+(\w+)\s*\([^)]+\)\s+returns\s+\([^)]+\)\s*\{')
+# Braces for finding the matching close; comments and string literals are consumed whole
+_BRACE_RE = re.compile(rb'//[^\n]*|/\*.*?\*/|"(?:[^"\\\n]|\\.)*"|([{}])', re.DOTALL)
+_SCOPE_RE = re.compile(rb'option\s+\(libops\.v1\.options\.required_scope\)\s*=\s*\{([^}]+)\}')
+_RESOURCE_RE = re.compile(rb'resource:\s*(RESOURCE_TYPE_\w+)')
+_LEVEL_RE = re.compile(rb'level:\s*(ACCESS_LEVEL_\w+)')
+_OAUTH_RE = re.compile(rb'oauth_scopes:\s*"([^"]+)"')
+
+
+def _scan_rpcs(content: bytes, start: int, end: int) -> Iterator[Tuple[str, bytes]]:
+    """Yield (method, options body) for each rpc with a body in content[start:end].
+
+    The body ends at the brace that brings the depth back to zero, so it is found
+    whatever the method's indentation.
+    """
+    pos = start
+    while True:
+        rpc_match = _RPC_RE.search(content, pos, end)
+        if not rpc_match:
+            return
+
+        body_start = rpc_match.end()
+        depth = 1
+        for token in _BRACE_RE.finditer(content, body_start, end):
+            brace = token.group(1)
+            if brace == b'{':
+                depth += 1
+            elif brace == b'}':
+                depth -= 1
+                if depth == 0:
+                    yield rpc_match.group(1).decode('ascii'), content[body_start:token.start()]
+                    pos = token.end()
+                    break
+        else:
+            # Unbalanced body; nothing after it can be matched reliably
+            return
+
+
+# Resource hierarchy shown in the OAuth scopes table for each resource type
+_RESOURCE_HIERARCHY = {
+    'account': ['Account'],
+    'organization': ['Organization'],
+    'project': ['Organization', 'Project'],
+    'site': ['Organization', 'Project', 'Site'],
+}
+
+# Simplified format matching user's preference
+_SCOPE_INFO_TEMPLATE = (
+    "\n\n### Authorization\n\n"
+    "An API key or OAuth token must have at least one of the following scopes in order to use this API endpoint:\n\n"
+    "**API Key Scopes**: `{scope_list}`\n"
+    "\n**OAuth Scopes**\n\n"
+    "| Resource | Scope |\n"
+    "|----------|-------|\n"
+    "{rows}"
+)
+
+
+@lru_cache(maxsize=256)
+def _build_scope_info(resource_str: str, oauth_scopes: Tuple[str, ...]) -> str:
+    """Build the Authorization section appended to an operation's description.
+
+    Only a handful of (resource, scopes) combinations occur, so each is rendered once.
+    """
+    resources = _RESOURCE_HIERARCHY.get(resource_str, [resource_str.title()])
+    rows = ''.join([f"| {res} | `{scope}` |\n" for res in resources for scope in oauth_scopes])
+    return _SCOPE_INFO_TEMPLATE.format(scope_list=', '.join(oauth_scopes), rows=rows)
+
 
 class ProtoScopeExtractor:
     """Extracts scope annotations from proto files."""
@@ -94,25 +169,21 @@ class ProtoScopeExtractor:
             if 'options' in str(proto_file):
                 # Skip option definition files
                 continue
-            self._parse_proto_file(proto_file)
+            self.method_scopes.update(self._parse_proto_file(proto_file))
 
         return self.method_scopes
 
-    def _parse_proto_file(self, proto_file: Path):
-        """Parse a single proto file to extract scope annotations."""
-        with open(proto_file, 'r') as f:
-            content = f.read()
+    def _parse_proto_file(self, proto_file: Path) -> Dict[str, Tuple[str, str, List[str]]]:
+        """Parse a single proto file and return its method_name -> scope annotations."""
+        content = proto_file.read_bytes()
+        file_scopes = {}
 
         # Extract package name
-        package_match = re.search(r'package\s+([\w.]+)\s*;', content)
-        package_name = package_match.group(1) if package_match else "libops.v1"
-
-        # Find RPC methods with their service context
-        # We'll match each rpc individually to avoid nested brace issues
-        rpc_pattern = r'service\s+(\w+)\s*\{.*?rpc\s+(\w+)\s*\([^)]+\)\s+returns\s+\([^)]+\)\s*\{([^}]*?)\};'
+        package_match = _PACKAGE_RE.search(content)
+        package_name = package_match.group(1).decode('ascii') if package_match else "libops.v1"
 
-        # Use a more robust approach: find each service, then find methods within it
-        service_starts = [(m.start(), m.group(1)) for m in re.finditer(r'service\s+(\w+)\s*\{', content)]
+        # Find each service, then match its methods individually to avoid nested brace issues
+        service_starts = [(m.start(), m.group(1).decode('ascii')) for m in _SERVICE_RE.finditer(content)]
 
         for i, (start_pos, service_name) in enumerate(service_starts):
             # Find the end of this service (next service or end of file)
@@ -121,29 +192,18 @@ class ProtoScopeExtractor:
             else:
                 end_pos = len(content)
 
-            service_content = content[start_pos:end_pos]
-
-            # Find RPC methods in this service
-            # Match rpc METHOD_NAME (Req) returns (Res) { options... }
-            # The pattern matches from "rpc" to the closing "}" with minimal matching
-            rpc_matches = re.finditer(
-                r'rpc\s+(\w+)\s*\([^)]+\)\s+returns\s+\([^)]+\)\s*\{(.*?)\n  \}',
-                service_content,
-                re.DOTALL
-            )
-
-            for method_match in rpc_matches:
-                method_name = method_match.group(1)
-                method_options = method_match.group(2)
-
+            # Find RPC methods in this service, searching in place rather than slicing it out
+            for method_name, method_options in _scan_rpcs(content, start_pos, end_pos):
                 # Extract scope annotation
                 scope = self._extract_scope_annotation(method_options)
                 if scope:
                     # Build full method name: package.ServiceName/MethodName
                     full_method_name = f"{package_name}.{service_name}/{method_name}"
-                    self.method_scopes[full_method_name] = scope
+                    file_scopes[full_method_name] = scope
 
-    def _extract_scope_annotation(self, method_options: str) -> Optional[Tuple[str, str, List[str]]]:
+        return file_scopes
+
+    def _extract_scope_annotation(self, method_options: bytes) -> Optional[Tuple[str, str, List[str]]]:
         """Extract resource, level, and oauth_scopes from scope annotation."""
         # Look for: option (libops.v1.options.required_scope) = {
         #   resource: RESOURCE_TYPE_XXX
@@ -152,8 +212,7 @@ class ProtoScopeExtractor:
         #   oauth_scopes: "scope2"
         # };
 
-        scope_pattern = r'option\s+\(libops\.v1\.options\.required_scope\)\s*=\s*\{([^}]+)\}'
-        scope_match = re.search(scope_pattern, method_options)
+        scope_match = _SCOPE_RE.search(method_options)
 
         if not scope_match:
             return None
@@ -161,21 +220,21 @@ class ProtoScopeExtractor:
         scope_content = scope_match.group(1)
 
         # Extract resource
-        resource_match = re.search(r'resource:\s*(RESOURCE_TYPE_\w+)', scope_content)
+        resource_match = _RESOURCE_RE.search(scope_content)
         if not resource_match:
             return None
-        resource = resource_match.group(1)
+        resource = resource_match.group(1).decode('ascii')
 
         # Extract level
-        level_match = re.search(r'level:\s*(ACCESS_LEVEL_\w+)', scope_content)
+        level_match = _LEVEL_RE.search(scope_content)
         if not level_match:
             return None
-        level = level_match.group(1)
+        level = level_match.group(1).decode('ascii')
 
         # Extract oauth_scopes (can be multiple)
         oauth_scopes = []
-        for oauth_match in re.finditer(r'oauth_scopes:\s*"([^"]+)"', scope_content):
-            oauth_scopes.append(oauth_match.group(1))
+        for oauth_match in _OAUTH_RE.finditer(scope_content):
+            oauth_scopes.append(oauth_match.group(1).decode('utf-8'))
 
         return (resource, level, oauth_scopes)
 
@@ -188,11 +247,19 @@ class OpenAPIScopesInjector:
         self.method_scopes = method_scopes
         self.spec = None
 
+        # Index the proto methods by the forms an operationId (with '_' removed) can take:
+        # "libops.v1.ServiceMethod", "ServiceMethod" and plain "Method". setdefault keeps
+        # the first method for each key, like the scan this replaces.
+        self._scope_index: Dict[str, Tuple[str, str, List[str]]] = {}
+        for method_name, scope in method_scopes.items():
+            service_method = method_name.rsplit('.', 1)[-1]
+            for key in (method_name.replace('/', ''), service_method.replace('/', ''), service_method.rsplit('/', 1)[-1]):
+                self._scope_index.setdefault(key, scope)
+
     def inject_scopes(self):
         """Inject OAuth scopes into the OpenAPI spec."""
         # Read OpenAPI spec
-        with open(self.openapi_file, 'r') as f:
-            self.spec = yaml.safe_load(f)
+        self.spec = load_spec(self.openapi_file)
 
         # Add OAuth2 security scheme
         self._add_security_scheme()
@@ -201,8 +268,7 @@ class OpenAPIScopesInjector:
         self._add_operation_security()
 
         # Write updated spec
-        with open(self.openapi_file, 'w') as f:
-            yaml.dump(self.spec, f, default_flow_style=False, sort_keys=False)
+        dump_spec(self.spec, self.openapi_file)
 
     def _add_security_scheme(self):
         """Add OAuth2 security scheme to components."""
@@ -253,13 +319,8 @@ class OpenAPIScopesInjector:
         # The operationId usually maps to the proto method
         operation_id = operation.get('operationId', '')
 
-        # Find matching proto method
-        proto_scope = None
-        for method_name, scope in self.method_scopes.items():
-            # Match by operation ID (usually ServiceName_MethodName)
-            if operation_id and operation_id.replace('_', '') in method_name.replace('/', ''):
-                proto_scope = scope
-                break
+        # Find matching proto method by operation ID (usually ServiceName_MethodName)
+        proto_scope = self._scope_index.get(operation_id.replace('_', '')) if operation_id else None
 
         if proto_scope:
             resource, level, oauth_scopes_from_proto = proto_scope
@@ -270,6 +331,10 @@ class OpenAPIScopesInjector:
             else:
                 oauth_scopes = SCOPE_MAPPING.get((resource, level), [])
 
+            # Already injected by an earlier run; rebuilding would append the Authorization section twice
+            if oauth_scopes and operation.get('x-scopes') == oauth_scopes:
+                return
+
             if oauth_scopes:
                 # Add security requirement
                 # User can authenticate with either OAuth2 OR API key
@@ -278,49 +343,21 @@ class OpenAPIScopesInjector:
                     {'apiKey': []}
                 ]
 
-                # Create a readable scope list for display
-                scope_list = ', '.join(f'`{s}`' for s in oauth_scopes)
                 resource_str = resource.replace('RESOURCE_TYPE_', '').lower()
                 level_str = level.replace('ACCESS_LEVEL_', '').lower()
+                scope_list_compact = ', '.join(oauth_scopes)
 
                 # Add summary with scope requirements (Mintlify shows summary prominently)
                 base_desc = operation.get('description', '').split('\n')[0] if 'description' in operation else ''
                 if base_desc:
                     # Append scope list to summary for visibility
-                    scope_list_compact = ', '.join(oauth_scopes)
                     operation['summary'] = f"{base_desc} [Requires: {scope_list_compact}]"
                 elif 'summary' not in operation:
                     # No existing description, create summary with scopes
-                    scope_list_compact = ', '.join(oauth_scopes)
                     operation['summary'] = f"[Requires: {scope_list_compact}]"
 
                 # Add comprehensive scope information to description
-                # Simplified format matching user's preference
-                scope_info = "\n\n### Authorization\n\n"
-                scope_info += "An API key or OAuth token must have at least one of the following scopes in order to use this API endpoint:\n\n"
-
-                # API Key section
-                scope_info += "**API Key Scopes**: `"
-                scope_info += ", ".join(oauth_scopes)
-                scope_info += "`\n"
-
-                # OAuth section with resource hierarchy
-                scope_info += "\n**OAuth Scopes**\n\n"
-                scope_info += "| Resource | Scope |\n"
-                scope_info += "|----------|-------|\n"
-
-                # Map the resource type to show hierarchy
-                resource_hierarchy = {
-                    'account': ['Account'],
-                    'organization': ['Organization'],
-                    'project': ['Organization', 'Project'],
-                    'site': ['Organization', 'Project', 'Site'],
-                }
-
-                resources = resource_hierarchy.get(resource_str, [resource_str.title()])
-                for res in resources:
-                    for scope in oauth_scopes:
-                        scope_info += f"| {res} | `{scope}` |\n"
+                scope_info = _build_scope_info(resource_str, tuple(oauth_scopes))
 
                 if 'description' in operation:
                     operation['description'] += scope_info